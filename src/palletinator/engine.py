@@ -6,26 +6,32 @@ business rules: callers decide where each cell goes and what extra
 metadata it carries.
 """
 
+from itertools import groupby
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
 from .models import Cell, Column, Pallet, Side
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .inputs import CellPlacement
 
 
 def build_pallet(
-    placements: list[CellPlacement],
+    placements: Iterable[CellPlacement],
     *,
     extras: dict[str, Any] | None = None,
 ) -> Pallet:
-    """Build a pallet from a list of cell placements.
+    """Build a pallet from an iterable of cell placements.
 
     Parameters
     ----------
     placements
         The cells to place. Each placement is materialised into one
-        ``Cell`` per ``(side, column)`` coordinate it specifies.
+        ``Cell`` per ``(side, column)`` coordinate it specifies. The
+        iterable is consumed in a single pass, so a lazy generator works
+        as well as a list.
     extras
         Open-ended metadata bag attached to the resulting ``Pallet``.
 
@@ -34,24 +40,28 @@ def build_pallet(
     Pallet
         A pallet whose sides and columns are sorted by number.
     """
-    buckets: dict[int, dict[int, list[CellPlacement]]] = {}
+    buckets: dict[tuple[int, int], list[CellPlacement]] = {}
     for placement in placements:
         for side_number in placement.sides:
             for column_number in placement.columns:
-                buckets.setdefault(side_number, {}).setdefault(column_number, []).append(placement)
-
-    sides: list[Side] = []
-    for side_number in sorted(buckets):
-        columns: list[Column] = []
-        for column_number in sorted(buckets[side_number]):
-            cells = [
-                Cell(value=placement.value, extras=dict(placement.extras))
-                for placement in buckets[side_number][column_number]
-            ]
-            columns.append(Column(number=column_number, cells=cells))
-        sides.append(Side(number=side_number, columns=columns))
+                buckets.setdefault((side_number, column_number), []).append(placement)
 
     return Pallet(
-        sides=sides,
+        sides=[
+            Side(
+                number=side_number,
+                columns=[
+                    Column(
+                        number=column_number,
+                        cells=[
+                            Cell(value=placement.value, extras=dict(placement.extras))
+                            for placement in buckets[side_number, column_number]
+                        ],
+                    )
+                    for _, column_number in coordinates
+                ],
+            )
+            for side_number, coordinates in groupby(sorted(buckets), key=itemgetter(0))
+        ],
         extras=dict(extras) if extras else {},
     )
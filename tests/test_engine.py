@@ -88,6 +88,29 @@ def test_column_keeps_all_placed_cells_in_order() -> None:
     assert [cell.value for cell in column.cells] == ["B1", "B2", "B3", "B4", "B5"]
 
 
+def test_build_pallet_does_not_mutate_the_placements_list() -> None:
+    placements = [
+        CellPlacement(value="A", sides=[1, 2], columns=[1]),
+        CellPlacement(value="B", sides=[1], columns=[2, 3]),
+    ]
+    snapshot = list(placements)
+
+    build_pallet(placements)
+
+    assert placements == snapshot
+    assert placements[0].sides == [1, 2]
+    assert placements[1].columns == [2, 3]
+
+
+def test_build_pallet_accepts_a_generator_of_placements() -> None:
+    placements = (CellPlacement(value=f"B{index}", sides=[1], columns=[1]) for index in range(1, 4))
+    pallet = build_pallet(placements)
+
+    [side] = pallet.sides
+    [column] = side.columns
+    assert [cell.value for cell in column.cells] == ["B1", "B2", "B3"]
+
+
 def test_placement_with_multiple_sides_and_columns_fans_out() -> None:
     pallet = build_pallet([CellPlacement(value="X", sides=[1, 2], columns=[1, 2])])
 